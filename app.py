@@ -42,20 +42,29 @@ import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, Request, status, BackgroundTasks
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 import uvicorn
 import os
+import hashlib
+import re
+from email.utils import formatdate
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import structlog
+from pydantic import ValidationError
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Import enterprise modules
 from src.config import settings, get_settings
 from src.ai_processor import VesselMaintenanceAI
-from src.models import ProcessingRequest, ProcessingResponse
+from src.models import ProcessingRequest, ProcessingRequestStruct, ProcessingResponse
 from src.database import DatabaseManager
 from src.tenant import (
     TenantManager, get_current_tenant, Tenant, TenantCreate, TenantUpdate,
@@ -189,75 +198,194 @@ if Path("static").exists():
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+# Fallback HTML content if template file is missing
+_FALLBACK_INDEX_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Vessel Maintenance AI System</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .container { max-width: 800px; margin: 0 auto; }
+        .header { text-align: center; margin-bottom: 40px; }
+        .section { margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 5px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚢 Vessel Maintenance AI System</h1>
+            <p>AI-powered document processing for maritime operations</p>
+        </div>
+        <div class="section">
+            <h2>Quick Start</h2>
+            <p>Use the API endpoints to process documents:</p>
+            <ul>
+                <li><strong>POST /process/text</strong> - Process text documents</li>
+                <li><strong>GET /analytics</strong> - View system analytics</li>
+                <li><strong>GET /health</strong> - Check system status</li>
+            </ul>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _load_index_html() -> Tuple[bytes, float]:
+    """
+    Load the web interface HTML once at startup.
+    
+    The dashboard is static, so it is read and encoded a single time and
+    served from memory together with a precomputed ETag.
+    
+    Returns:
+        Tuple[bytes, float]: UTF-8 encoded HTML page and its modification
+                             time (the epoch for the built-in fallback page)
+    """
+    try:
+        # Check if custom template exists, otherwise use default
+        template_path = Path("templates/index.html")
+        if template_path.exists():
+            return template_path.read_bytes(), template_path.stat().st_mtime
+    except OSError as e:
+        logger.warning(f"Error loading web interface template: {e}")
+    return _FALLBACK_INDEX_HTML.encode("utf-8"), 0.0
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Handles "*", comma-separated lists and weak W/ tags, using the weak
+    comparison that RFC 9110 prescribes for If-None-Match.
+    
+    Args:
+        if_none_match (Optional[str]): Raw If-None-Match header value
+        etag (str): Strong ETag of the current representation
+    
+    Returns:
+        bool: True if the client already holds this representation
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+_INDEX_BYTES, _INDEX_MTIME = _load_index_html()
+_INDEX_ETAG = '"' + hashlib.blake2b(_INDEX_BYTES, digest_size=8).hexdigest() + '"'
+_INDEX_HEADERS = {
+    "ETag": _INDEX_ETAG,
+    "Last-Modified": formatdate(_INDEX_MTIME, usegmt=True),
+    "Cache-Control": "public, max-age=3600"
+}
+
+
 @app.get("/", response_class=HTMLResponse)
-async def serve_web_interface():
+async def serve_web_interface(request: Request):
     """
     Serve the main web interface for the vessel maintenance AI system.
     
     Returns the HTML page that provides an interactive interface for
     users to process documents, view analytics, and monitor system status.
+    Clients presenting a matching If-None-Match header receive an empty
+    304 response instead of the full page.
+    
+    Args:
+        request (Request): Incoming request, inspected for If-None-Match
     
     Returns:
-        HTMLResponse: The main web interface HTML page
+        Response: The main web interface HTML page, or 304 Not Modified
+    """
+    if _etag_matches(request.headers.get("if-none-match"), _INDEX_ETAG):
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    
+    return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
+
+
+# Parts of a msgspec error message: the trailing JSON path and a missing field name
+_MSGSPEC_PATH_RE = re.compile(r" - at `\$(?P<path>[^`]*)`$")
+_MSGSPEC_PATH_PART_RE = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MSGSPEC_MISSING_RE = re.compile(r"^Object missing required field `(?P<field>[^`]+)`")
+
+
+def _msgspec_error_detail(error: Exception) -> List[Dict[str, Any]]:
     """
+    Convert a msgspec decode or validation error to FastAPI's 422 detail shape.
+    
+    Clients get the same list of {"loc", "msg", "type"} objects whether the
+    body was decoded by msgspec or by the pydantic fallback.
+    
+    Args:
+        error (Exception): msgspec.DecodeError or msgspec.ValidationError
+    
+    Returns:
+        List[Dict[str, Any]]: A single pydantic-style error object
+    """
+    message = str(error)
+    loc: List[Any] = ["body"]
+    error_type = "json_invalid" if not isinstance(error, msgspec.ValidationError) else "value_error"
+    
+    path_match = _MSGSPEC_PATH_RE.search(message)
+    missing_match = _MSGSPEC_MISSING_RE.match(message)
+    if path_match:
+        message = message[:path_match.start()]
+        for key, index in _MSGSPEC_PATH_PART_RE.findall(path_match.group("path")):
+            loc.append(int(index) if index else key)
+    if missing_match:
+        loc.append(missing_match.group("field"))
+        message = "Field required"
+        error_type = "missing"
+    
+    return [{"loc": loc, "msg": message, "type": error_type}]
+
+
+def _decode_processing_request(body: bytes):
+    """
+    Decode a /process/text request body.
+    
+    Uses msgspec when available, which is several times faster than pydantic
+    for this flat schema, and falls back to pydantic validation otherwise.
+    
+    Args:
+        body (bytes): Raw JSON request body
+    
+    Returns:
+        ProcessingRequestStruct or ProcessingRequest: Decoded request
+    
+    Raises:
+        HTTPException: If the body is not valid JSON or does not match the schema
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(body, type=ProcessingRequestStruct)
+        except (msgspec.DecodeError, msgspec.ValidationError) as e:
+            raise HTTPException(status_code=422, detail=_msgspec_error_detail(e))
+    
     try:
-        # Check if custom template exists, otherwise use default
-        template_path = Path("templates/index.html")
-        if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        else:
-            # Fallback HTML content if template file is missing
-            html_content = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Vessel Maintenance AI System</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 40px; }
-                    .container { max-width: 800px; margin: 0 auto; }
-                    .header { text-align: center; margin-bottom: 40px; }
-                    .section { margin-bottom: 30px; padding: 20px; border: 1px solid #ddd; border-radius: 5px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>🚢 Vessel Maintenance AI System</h1>
-                        <p>AI-powered document processing for maritime operations</p>
-                    </div>
-                    <div class="section">
-                        <h2>Quick Start</h2>
-                        <p>Use the API endpoints to process documents:</p>
-                        <ul>
-                            <li><strong>POST /process/text</strong> - Process text documents</li>
-                            <li><strong>GET /analytics</strong> - View system analytics</li>
-                            <li><strong>GET /health</strong> - Check system status</li>
-                        </ul>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-        
-        return HTMLResponse(content=html_content)
-        
-    except Exception as e:
-        # Return a simple error page if something goes wrong
-        error_html = f"""
-        <html>
-            <body>
-                <h1>Vessel Maintenance AI System</h1>
-                <p>Error loading interface: {str(e)}</p>
-                <p>API is still available at the documented endpoints.</p>
-            </body>
-        </html>
-        """
-        return HTMLResponse(content=error_html)
-
-
-@app.post("/process/text", response_model=ProcessingResponse)
-async def process_text_document(request: ProcessingRequest):
+        return ProcessingRequest.model_validate_json(body)
+    except ValidationError as e:
+        # Same shape FastAPI produces for body validation errors
+        raise HTTPException(status_code=422, detail=[
+            {**error, "loc": ["body", *error["loc"]]} for error in e.errors(include_url=False)
+        ])
+
+
+@app.post(
+    "/process/text",
+    response_model=ProcessingResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": ProcessingRequest.model_json_schema()}},
+            "required": True
+        }
+    }
+)
+async def process_text_document(http_request: Request):
     """
     Process a text document through the AI analysis pipeline.
     
@@ -265,9 +393,13 @@ async def process_text_document(request: ProcessingRequest):
     it through the vessel maintenance AI system to extract insights,
     classify issues, and generate actionable recommendations.
     
+    The body is decoded manually (see _decode_processing_request) and the
+    result is serialized by pydantic-core directly, bypassing FastAPI's
+    per-request model validation on both sides.
+    
     Args:
-        request (ProcessingRequest): The document processing request containing
-                                   text content and optional metadata
+        http_request (Request): Incoming request whose JSON body matches
+                                ProcessingRequest
     
     Returns:
         ProcessingResponse: Comprehensive analysis results including classification,
@@ -277,6 +409,8 @@ async def process_text_document(request: ProcessingRequest):
         HTTPException: If processing fails or invalid input is provided
     """
     try:
+        request = _decode_processing_request(await http_request.body())
+        
         # Validate input
         if not request.text or len(request.text.strip()) < 10:
             raise HTTPException(
@@ -294,7 +428,7 @@ async def process_text_document(request: ProcessingRequest):
         # Store the result in the database for analytics and history
         db_manager.save_result(result)
         
-        return result
+        return Response(content=result.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors)
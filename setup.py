@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def print_banner():
@@ -40,17 +41,39 @@ def install_dependencies():
     print("\n📦 Installing Python dependencies...")
     
     try:
+        # Discard pip's progress output instead of buffering it in memory,
+        # and skip pip's self version check (an extra HTTPS round-trip)
         subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], check=True, capture_output=True)
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check", "--prefer-binary", "-q",
+            "-r", "requirements.txt"
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         print("✅ Dependencies installed successfully")
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing dependencies: {e}")
+        if e.stderr:
+            print(e.stderr.decode(errors="replace").strip())
         print("   Please run: pip install -r requirements.txt")
         return False
     
     return True
 
+def install_optional_dependencies():
+    """Install optional accelerator packages (non-critical)"""
+    print("\n⚡ Installing optional accelerators...")
+    
+    try:
+        subprocess.run([
+            sys.executable, "-m", "pip", "install",
+            "--no-input", "--disable-pip-version-check", "--prefer-binary", "-q",
+            "-r", "requirements-optional.txt"
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        print("✅ Optional accelerators installed")
+    except subprocess.CalledProcessError:
+        print("⚠️  Warning: optional accelerators could not be installed")
+        print("   The system will use its pure Python/NumPy code paths")
+        print("   To install manually: pip install -r requirements-optional.txt")
+
 def setup_spacy_model():
     """Download spaCy language model"""
     print("\n🧠 Setting up NLP language model...")
@@ -74,6 +97,8 @@ def create_directories():
     for directory in directories:
         Path(directory).mkdir(exist_ok=True)
         print(f"✅ Created directory: {directory}")
+    
+    return True
 
 def setup_database():
     """Initialize the database"""
@@ -142,6 +167,8 @@ python app.py
         os.chmod("start.sh", 0o755)
     
     print("✅ Created start.sh script")
+    
+    return True
 
 def create_sample_config():
     """Create sample configuration file"""
@@ -172,6 +199,8 @@ ANALYTICS_CACHE_MINUTES=30
         f.write(config_content)
     
     print("✅ Created .env.example configuration file")
+    
+    return True
 
 def print_next_steps():
     """Print next steps for the user"""
@@ -225,24 +254,40 @@ def main():
         print("❌ Installation cancelled")
         sys.exit(0)
     
-    # Perform installation steps
-    steps = [
-        ("Installing dependencies", install_dependencies),
-        ("Creating directories", create_directories),
-        ("Setting up database", setup_database),
-        ("Testing installation", test_installation),
-        ("Creating startup script", create_startup_script),
-        ("Creating sample config", create_sample_config),
-    ]
-    
-    for step_name, step_func in steps:
-        print(f"\n🔄 {step_name}...")
-        if not step_func():
-            print(f"❌ Setup failed at: {step_name}")
-            sys.exit(1)
-    
-    # Optional spaCy model (non-critical)
-    setup_spacy_model()
+    # Network-bound and file-creation steps are independent of each other,
+    # so run them concurrently; subprocess waits release the GIL.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        dependencies = executor.submit(install_dependencies)
+        # Optional spaCy model (non-critical)
+        spacy_model = executor.submit(setup_spacy_model)
+        independent_steps = [
+            ("Creating directories", executor.submit(create_directories)),
+            ("Creating startup script", executor.submit(create_startup_script)),
+            ("Creating sample config", executor.submit(create_sample_config)),
+        ]
+        
+        for step_name, future in [("Installing dependencies", dependencies)] + independent_steps:
+            if not future.result():
+                print(f"❌ Setup failed at: {step_name}")
+                sys.exit(1)
+        
+        # Optional accelerators build on the core packages (non-critical).
+        # Finish them before the steps below import the modules that use them.
+        install_optional_dependencies()
+        
+        # Database setup and installation test need the dependencies installed
+        steps = [
+            ("Setting up database", setup_database),
+            ("Testing installation", test_installation),
+        ]
+        
+        for step_name, step_func in steps:
+            print(f"\n🔄 {step_name}...")
+            if not step_func():
+                print(f"❌ Setup failed at: {step_name}")
+                sys.exit(1)
+        
+        spacy_model.result()
     
     # Show completion message
     print_next_steps()
@@ -1 +1,33 @@
-# Vessel Maintenance AI System - Source Package
\ No newline at end of file
+# Vessel Maintenance AI System - Source Package
+#
+# Public classes are resolved lazily (PEP 562) so that importing a light
+# submodule such as src.simple_config does not pull in NLTK, scikit-learn,
+# pydantic or the database layer. Each name is imported on first access.
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "VesselMaintenanceAI": ".ai_processor",
+    "DatabaseManager": ".database",
+    "ProcessingRequest": ".models",
+    "ProcessingResponse": ".models",
+    "AnalyticsData": ".models",
+    "ClassificationType": ".models",
+    "PriorityLevel": ".models",
+    "DocumentType": ".models",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,7 +6,7 @@ documents, sensor alerts, and incident reports. It provides intelligent classifi
 entity extraction, keyword analysis, and risk assessment capabilities.
 
 Key Features:
-- Natural Language Processing using NLTK and TextBlob
+- Natural Language Processing using NLTK
 - Pattern-based document classification 
 - Entity extraction (equipment, measurements, dates, personnel)
 - Keyword analysis and text summarization
@@ -24,24 +24,170 @@ Licensed under the MIT License. See LICENSE file for details.
 
 import re
 import json
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import threading
+from queue import Queue
 from typing import List, Dict, Any, Tuple
 from datetime import datetime
 import uuid
+import zlib
+from collections import Counter, OrderedDict
+from functools import cached_property
 
 # Natural Language Processing libraries
 import nltk
-from textblob import TextBlob
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from nltk.tokenize import PunktTokenizer
 import numpy as np
 
+# Optional multi-pattern matcher; falls back to plain substring checks
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional JIT compiler for the classification scoring kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Import data models for type safety
 from .models import (
     ProcessingResponse, ClassificationType, PriorityLevel, 
     DocumentType, KeywordPattern
 )
 
+# Text normalization patterns used by _preprocess_text
+_SPECIAL_RE = re.compile(r'[^\w\s\.\,\;\:\!\?\-\(\)]')
+# str.translate table blanking the same ASCII characters _SPECIAL_RE removes
+_SPECIAL_ASCII = {c: ord(' ') for c in range(128) if _SPECIAL_RE.match(chr(c))}
+_REPEAT_PUNCT_RE = re.compile(r'([\.\!])\1+')
+
+# Entity patterns used by _extract_entities (matched against lowercased text)
+_EQUIPMENT_RE = re.compile(
+    r'\b(engine|motor|pump|valve|turbine|generator|propeller'
+    r'|radar|gps|compass|navigation|steering'
+    r'|hull|deck|bridge|compartment)\b'
+)
+_DATE_RE = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')
+_MEASUREMENT_RE = re.compile(
+    r'\b\d+\.?\d*\s*(meters?|feet|inches|kg|lbs|degrees?|psi|bar)\b'
+)
+
+# Word tokens for keyword frequency analysis (keeps hyphenated identifiers)
+_WORD_RE = re.compile(r"\w+(?:[-']\w+)*")
+
+# Common words excluded from keyword extraction
+_STOPWORDS = frozenset({
+    "the", "and", "for", "are", "with", "that", "this", "from", "have",
+    "has", "had", "were", "was", "been", "being", "will", "would", "should",
+    "could", "into", "onto", "over", "under", "after", "before", "during",
+    "while", "than", "then", "there", "their", "they", "them", "these",
+    "those", "which", "what", "when", "where", "also", "some", "such",
+    "each", "other", "only", "very", "more", "most", "must", "does", "about"
+})
+
+
+
+def _score_classifications(W: np.ndarray, presence: np.ndarray) -> Tuple[int, float, float]:
+    """
+    Score every classification from a term presence vector.
+    
+    Args:
+        W (np.ndarray): (classification x term) weight matrix
+        presence (np.ndarray): 0/1 indicator for each term
+        
+    Returns:
+        Tuple[int, float, float]: Index of the best classification, its
+            score, and its share of the total score
+    """
+    scores = W @ presence
+    best = int(scores.argmax())
+    total = scores.sum()
+    confidence = scores[best] / total if total > 0 else 0.0
+    return best, float(scores[best]), float(confidence)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _score_classifications(W, presence):
+        best = 0
+        best_score = -1.0
+        total = 0.0
+        for i in range(W.shape[0]):
+            score = 0.0
+            for j in range(W.shape[1]):
+                if presence[j]:
+                    score += W[i, j]
+            total += score
+            if score > best_score:
+                best = i
+                best_score = score
+        confidence = best_score / total if total > 0 else 0.0
+        return best, best_score, confidence
+
+
+class HashingTFEncoder:
+    """
+    Fixed-size, vocabulary-free term-frequency encoder.
+    
+    N-grams are hashed into n_features buckets with CRC32, so there is no
+    vocabulary to fit or hold in memory and vectors are stable across
+    processes. Vectors are L2-normalized, making cosine similarity a
+    single dot product.
+    
+    Attributes:
+        n_features: Length of the encoded vectors
+        ngram_range: Smallest and largest n-gram size to encode
+    """
+    
+    __slots__ = ("n_features", "ngram_range")
+    
+    def __init__(self, n_features: int = 1024, ngram_range: Tuple[int, int] = (1, 1)):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+    
+    def transform(self, text: str) -> np.ndarray:
+        """
+        Encode a text as an L2-normalized hashed term-frequency vector.
+        
+        Args:
+            text (str): Text to encode
+            
+        Returns:
+            np.ndarray: float32 vector of length n_features
+        """
+        tokens = [word for word in _WORD_RE.findall(text.lower()) if word not in _STOPWORDS]
+        
+        min_n, max_n = self.ngram_range
+        buckets = [
+            zlib.crc32(" ".join(tokens[i:i + n]).encode()) % self.n_features
+            for n in range(min_n, max_n + 1)
+            for i in range(len(tokens) - n + 1)
+        ]
+        
+        vector = np.bincount(buckets, minlength=self.n_features).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+    
+    def similarity(self, text_a: str, text_b: str) -> float:
+        """
+        Cosine similarity between two texts.
+        
+        Args:
+            text_a (str): First text
+            text_b (str): Second text
+            
+        Returns:
+            float: Similarity in [0, 1]
+        """
+        return float(np.dot(self.transform(text_a), self.transform(text_b)))
+
 
 class VesselMaintenanceAI:
     """
@@ -56,10 +202,181 @@ class VesselMaintenanceAI:
     
     Attributes:
         logger: Logger instance for tracking operations
-        vectorizer: TF-IDF vectorizer for text similarity analysis
+        vectorizer: Hashed term-frequency encoder for text similarity analysis
         patterns: Classification patterns for document categorization
     """
     
+    # Score contribution of a single matched term, per pattern bucket
+    TERM_BUCKETS = {
+        "keywords": 0.4,
+        "equipment_terms": 0.3,
+        "priority_indicators": 0.3
+    }
+    
+    # NLTK data required at runtime, as (resource path, download package)
+    NLTK_RESOURCES = (
+        ("tokenizers/punkt", "punkt"),                    # Sentence tokenization
+        ("tokenizers/punkt_tab", "punkt_tab"),            # Punkt parameters
+        ("corpora/stopwords", "stopwords"),               # Stop words list
+        ("sentiment/vader_lexicon.zip", "vader_lexicon")  # Sentiment analysis
+    )
+    
+    # Set once the NLTK resources have been verified for this process
+    _NLTK_READY = False
+    
+    # Priority indicators, from most to least urgent
+    CRITICAL_KEYWORDS = frozenset({
+        "critical", "emergency", "immediate", "urgent", "danger",
+        "failure", "shutdown", "stop", "collision", "fire", "flood"
+    })
+    HIGH_KEYWORDS = frozenset({
+        "warning", "alert", "malfunction", "leak", "damage",
+        "hazard", "risk", "violation", "non-compliance"
+    })
+    MEDIUM_KEYWORDS = frozenset({
+        "attention", "monitor", "check", "inspect", "service",
+        "repair", "replace", "maintenance"
+    })
+    
+    # Terms that escalate classification-based priorities
+    ENVIRONMENTAL_CRITICAL_TERMS = frozenset({"spill", "discharge", "violation"})
+    SAFETY_HIGH_TERMS = frozenset({"accident", "injury"})
+    
+    # Base risk statement by priority level; anything else is treated as low
+    RISK_BY_PRIORITY = {
+        PriorityLevel.CRITICAL: "CRITICAL RISK: Immediate threat to vessel safety, operations, or environment.",
+        PriorityLevel.HIGH: "HIGH RISK: Significant impact on operations or safety if not addressed promptly.",
+        PriorityLevel.MEDIUM: "MEDIUM RISK: Moderate impact on operations, requires attention within reasonable timeframe.",
+        PriorityLevel.LOW: "LOW RISK: Minor operational impact, routine maintenance required."
+    }
+    
+    # Risk factors as (label, term groups); every group must have a hit
+    RISK_FACTORS = (
+        ("Navigation safety impact", (frozenset({"navigation", "gps"}),)),
+        ("Fire/explosion hazard", (frozenset({"fire", "explosion"}),)),
+        ("Environmental impact", (frozenset({"pollution", "spill"}),)),
+        ("Pressure system risk", (frozenset({"pressure"}),)),
+        ("Overheating risk", (frozenset({"temperature"}), frozenset({"high", "hot"})))
+    )
+    
+    # Document type indicators, checked in order
+    DOCUMENT_TYPE_KEYWORDS = (
+        (DocumentType.SENSOR_ALERT, ("alert", "alarm", "sensor", "warning")),
+        (DocumentType.INCIDENT_REPORT, ("incident", "accident", "spill", "collision")),
+        (DocumentType.INSPECTION_REPORT, ("inspection", "survey", "audit", "examination"))
+    )
+    
+    # Recommended actions by priority level
+    PRIORITY_RECOMMENDATIONS = {
+        PriorityLevel.CRITICAL: (
+            "IMMEDIATE ACTION REQUIRED",
+            "Stop operations immediately if safe to do so",
+            "Contact technical support team",
+            "Initiate emergency response procedures",
+            "Document all findings thoroughly"
+        ),
+        PriorityLevel.HIGH: (
+            "Address within 24 hours",
+            "Notify relevant personnel",
+            "Schedule immediate inspection",
+            "Prepare contingency plans"
+        )
+    }
+    
+    # Recommended actions by classification
+    CLASSIFICATION_RECOMMENDATIONS = {
+        ClassificationType.CRITICAL_EQUIPMENT_FAILURE: (
+            "Isolate affected equipment",
+            "Order replacement parts immediately",
+            "Consider emergency port call if necessary",
+            "Implement backup systems if available"
+        ),
+        ClassificationType.NAVIGATIONAL_HAZARD: (
+            "Increase bridge watch",
+            "Use manual navigation procedures",
+            "Contact vessel traffic services",
+            "Reduce speed if conditions warrant"
+        ),
+        ClassificationType.ENVIRONMENTAL_COMPLIANCE: (
+            "Stop any discharge operations",
+            "Contact environmental compliance officer",
+            "Prepare incident report for authorities",
+            "Implement containment measures"
+        ),
+        ClassificationType.ROUTINE_MAINTENANCE: (
+            "Schedule maintenance during next port call",
+            "Order required spare parts",
+            "Assign qualified personnel",
+            "Update maintenance logs"
+        ),
+        ClassificationType.SAFETY_VIOLATION: (
+            "Immediate safety briefing for crew",
+            "Review safety procedures",
+            "Ensure proper PPE usage",
+            "Report to safety officer"
+        ),
+        ClassificationType.FUEL_EFFICIENCY: (
+            "Monitor fuel consumption patterns",
+            "Optimize engine parameters",
+            "Review voyage planning",
+            "Consider trim adjustments"
+        )
+    }
+    
+    # General follow-up actions for lower priority documents
+    _GENERAL_FOLLOW_UP = (
+        "Monitor pressure levels continuously",
+        "Investigate leak source and implement temporary repairs"
+    )
+    FOLLOW_UP_RECOMMENDATIONS = {
+        PriorityLevel.MEDIUM: _GENERAL_FOLLOW_UP,
+        PriorityLevel.LOW: _GENERAL_FOLLOW_UP
+    }
+    
+    # Explanation sentences by classification
+    CLASSIFICATION_DETAILS = {
+        ClassificationType.CRITICAL_EQUIPMENT_FAILURE: (
+            "Critical equipment failure detected. Immediate attention required to prevent operational disruption or safety hazards.",
+        ),
+        ClassificationType.NAVIGATIONAL_HAZARD: (
+            "Navigation-related issue identified. Take appropriate measures to ensure safe navigation.",
+        ),
+        ClassificationType.ENVIRONMENTAL_COMPLIANCE: (
+            "Environmental compliance issue detected. Immediate action needed to prevent regulatory violations.",
+        ),
+        ClassificationType.ROUTINE_MAINTENANCE: (
+            "Routine maintenance requirement identified. Schedule appropriate maintenance activities.",
+        ),
+        ClassificationType.SAFETY_VIOLATION: (
+            "Safety violation detected. Review and reinforce safety procedures immediately.",
+        ),
+        ClassificationType.FUEL_EFFICIENCY: (
+            "Fuel efficiency concern identified. Consider optimization measures to improve performance.",
+        )
+    }
+    
+    # Explanation sentences by priority level
+    PRIORITY_DETAILS = {
+        PriorityLevel.CRITICAL: (
+            "CRITICAL priority requires immediate action to prevent serious consequences.",
+        ),
+        PriorityLevel.HIGH: (
+            "HIGH priority should be addressed within 24 hours to prevent escalation.",
+        )
+    }
+    
+    # Generic operational details appended to every explanation
+    GENERAL_DETAILS = (
+        "Pressure-related issue identified - monitor system pressure closely.",
+        "Temperature anomaly detected - check cooling systems and ventilation."
+    )
+    
+    # Number of analyzed documents kept for repeated submissions
+    RESULT_CACHE_SIZE = 1024
+    
+    # Classification tables shared by every instance, built on first use
+    patterns = None
+    
     def __init__(self):
         """
         Initialize the AI processor with all required components.
@@ -68,75 +385,122 @@ class VesselMaintenanceAI:
         - Logging configuration
         - Natural language processing tools
         - Classification patterns
-        - Text vectorization components
+        
+        The text similarity encoder is created lazily on first access.
         """
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
         self._initialize_nlp()
+        self._setup_sentence_tokenizer()
         self._load_classification_patterns()
-        self._setup_vectorizer()
+        
+        # LRU cache of analysis results keyed by document content hash
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
     def _setup_logging(self):
         """
         Configure logging for the AI processor.
         
         Creates log files in the logs/ directory and sets up both file
-        and console logging with appropriate formatting.
+        and console logging with appropriate formatting. Records are handed
+        to a background listener through a queue, and file writes are
+        batched, so processing never blocks on log I/O. Does nothing if
+        logging has already been configured.
         """
+        if logging.getLogger().handlers:
+            return
+        
+        log_queue = Queue(-1)
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('logs/ai_processor.log'),
-                logging.StreamHandler()
-            ]
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
+        # Buffer file writes; warnings and errors are flushed immediately
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.WARNING,
+            target=logging.FileHandler('logs/ai_processor.log')
+        )
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, logging.StreamHandler()
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        
     def _initialize_nlp(self):
         """
         Initialize Natural Language Processing components.
         
         Downloads required NLTK data if not already present and sets up
-        basic NLP processing capabilities using NLTK and TextBlob.
+        basic NLP processing capabilities using NLTK. The check
+        runs once per process; later instances skip it.
         """
+        if VesselMaintenanceAI._NLTK_READY:
+            return
+        
         try:
-            # Download required NLTK data packages
-            nltk.download('punkt', quiet=True)        # Sentence tokenization
-            nltk.download('stopwords', quiet=True)    # Stop words list
-            nltk.download('vader_lexicon', quiet=True) # Sentiment analysis
+            # Download required NLTK data packages only when missing
+            for resource_path, package in self.NLTK_RESOURCES:
+                try:
+                    nltk.data.find(resource_path)
+                except LookupError:
+                    nltk.download(package, quiet=True)
+            
+            VesselMaintenanceAI._NLTK_READY = True
             
             # Log successful initialization
-            self.logger.info("Using NLTK and TextBlob for NLP processing")
+            self.logger.info("Using NLTK for NLP processing")
             
         except Exception as e:
             self.logger.error(f"Error initializing NLP: {e}")
             
-    def _setup_vectorizer(self):
+    def _setup_sentence_tokenizer(self):
+        """
+        Load the Punkt sentence tokenizer used for document summaries.
+        
+        The tokenizer is created once per processor instead of once per
+        document. If the Punkt data is unavailable, summaries fall back to
+        plain truncation.
+        """
+        try:
+            self.sentence_tokenizer = PunktTokenizer()
+        except LookupError as e:
+            self.logger.warning(f"Punkt sentence tokenizer unavailable: {e}")
+            self.sentence_tokenizer = None
+            
+    @cached_property
+    def vectorizer(self):
         """
-        Setup TF-IDF vectorizer for similarity matching.
+        Hashed term-frequency encoder for similarity matching, created on first use.
+        
+        Nothing on the document processing path needs it, so it is not
+        built in __init__.
         
-        Configures the vectorizer with maritime-specific parameters:
-        - Maximum 1000 features to prevent overfitting
-        - English stop words removal
+        Configures the encoder with maritime-specific parameters:
+        - 1024 hashed features, independent of corpus size
         - N-gram range 1-3 for capturing maritime terminology
-        - Case insensitive processing
+        - Case insensitive processing with common words removed
         """
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000,      # Limit features for performance
-            stop_words='english',   # Remove common English words
-            ngram_range=(1, 3),     # Capture single words and phrases
-            lowercase=True          # Normalize case
-        )
+        return HashingTFEncoder(n_features=1024, ngram_range=(1, 3))
         
-    def _load_classification_patterns(self):
+    @classmethod
+    def _load_classification_patterns(cls):
         """
         Load predefined patterns for document classification.
         
         Defines keyword patterns and weights for each classification category.
         These patterns are used to identify document types and assign
-        appropriate classifications and priorities.
+        appropriate classifications and priorities. The patterns and the
+        matcher built from them are stored on the class, so only the first
+        instance pays for building them.
         """
-        self.patterns = {
+        if cls.patterns is not None:
+            return
+        
+        patterns = {
             # Critical Equipment Failure Patterns
             ClassificationType.CRITICAL_EQUIPMENT_FAILURE: {
                 "keywords": [
@@ -226,6 +590,89 @@ class VesselMaintenanceAI:
                 "weight": 0.4
             }
         }
+        
+        # Freeze the term lists; a term only ever counts once per bucket
+        for pattern_data in patterns.values():
+            for bucket in cls.TERM_BUCKETS:
+                pattern_data[bucket] = frozenset(pattern_data[bucket])
+        
+        cls._build_term_automaton(patterns)
+        
+        # Publish last so other instances never see a half-built matcher
+        cls.patterns = patterns
+    
+    @classmethod
+    def _build_term_automaton(cls, patterns: Dict[str, Dict[str, Any]]):
+        """
+        Compile every term the analysis looks for into a single matcher.
+        
+        Builds a term index over the classification, priority, risk and
+        document type vocabularies, plus a (classification x term) weight
+        matrix so that one pass over the text and a single matrix-vector
+        product yield every category score. Uses an Aho-Corasick automaton
+        for the pass when pyahocorasick is installed.
+        
+        Args:
+            patterns (Dict[str, Dict[str, Any]]): Classification patterns
+        """
+        classifications = list(patterns)
+        term_index = {}
+        for pattern_data in patterns.values():
+            for bucket in cls.TERM_BUCKETS:
+                for term in sorted(pattern_data[bucket]):
+                    term_index.setdefault(term, len(term_index))
+        
+        # Terms that only feed priority, risk and document type decisions
+        extra_terms = set().union(
+            cls.CRITICAL_KEYWORDS, cls.HIGH_KEYWORDS, cls.MEDIUM_KEYWORDS,
+            cls.ENVIRONMENTAL_CRITICAL_TERMS, cls.SAFETY_HIGH_TERMS
+        )
+        for _, groups in cls.RISK_FACTORS:
+            for group in groups:
+                extra_terms.update(group)
+        for _, keywords in cls.DOCUMENT_TYPE_KEYWORDS:
+            extra_terms.update(keywords)
+        for term in sorted(extra_terms):
+            term_index.setdefault(term, len(term_index))
+        
+        # Each distinct term contributes its bucket weight once per bucket,
+        # scaled by the category weight
+        W = np.zeros((len(classifications), len(term_index)))
+        for row, classification in enumerate(classifications):
+            pattern_data = patterns[classification]
+            for bucket, bucket_weight in cls.TERM_BUCKETS.items():
+                for term in pattern_data[bucket]:
+                    W[row, term_index[term]] += bucket_weight
+            W[row] *= pattern_data["weight"]
+        
+        automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for term in term_index:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+        
+        cls._classifications = classifications
+        cls._term_index = term_index
+        cls._W = W
+        cls._automaton = automaton
+    
+    def _scan(self, text_lower: str) -> set:
+        """
+        Find every known term in the text in a single pass.
+        
+        The result is shared by classification, priority, risk and document
+        type detection so the text is scanned only once.
+        
+        Args:
+            text_lower (str): Preprocessed, lowercased document text
+            
+        Returns:
+            set: Terms present in the text (substring matches)
+        """
+        if self._automaton is not None:
+            return {term for _, term in self._automaton.iter(text_lower)}
+        return {term for term in self._term_index if term in text_lower}
     
     def process_document(self, text: str, document_type: str = None, 
                         vessel_id: str = None) -> ProcessingResponse:
@@ -233,7 +680,9 @@ class VesselMaintenanceAI:
         Process a single document and return comprehensive analysis results.
         
         This is the main entry point for document processing. It coordinates
-        all analysis steps and returns a structured response.
+        all analysis steps and returns a structured response. Analysis is
+        deterministic, so resubmitted documents are answered from a small
+        LRU cache with a fresh ID, timestamp and vessel ID.
         
         Args:
             text (str): The document text to analyze
@@ -244,38 +693,66 @@ class VesselMaintenanceAI:
             ProcessingResponse: Comprehensive analysis results including
                 classification, priority, summary, entities, and recommendations
         """
+        # Nothing to analyze in empty or whitespace-only input
+        if not text or text.isspace():
+            return self._create_error_response("Document text is empty")
+        
+        cache_key = hashlib.blake2b(
+            f"{document_type or ''}\0{text}".encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).digest()
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+        if cached is not None:
+            return cached.model_copy(
+                update={
+                    "id": uuid.uuid4().hex,
+                    "vessel_id": vessel_id,
+                    "timestamp": datetime.now()
+                },
+                deep=True
+            )
+        
         try:
-            self.logger.info(f"Processing document of length {len(text)}")
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info(f"Processing document of length {len(text)}")
             
             # Step 1: Clean and preprocess the text
             cleaned_text = self._preprocess_text(text)
             
-            # Step 2: Classify the document into appropriate category
-            classification, confidence = self._classify_document(cleaned_text)
+            # Step 2: Find all indicator terms in one pass over the text
+            text_lower = cleaned_text.lower()
+            hits = self._scan(text_lower)
             
-            # Step 3: Determine priority level based on content analysis
-            priority = self._determine_priority(cleaned_text, classification)
+            # Step 3: Classify the document into appropriate category
+            classification, confidence = self._classify_document(hits)
             
-            # Step 4: Generate concise summary of the document
+            # Step 4: Determine priority level based on content analysis
+            priority = self._determine_priority(hits, classification)
+            
+            # Step 5: Generate concise summary of the document
             summary = self._generate_summary(cleaned_text)
             
-            # Step 5: Extract relevant entities and keywords
-            entities = self._extract_entities(cleaned_text)
-            keywords = self._extract_keywords(cleaned_text)
+            # Step 6: Extract relevant entities and keywords
+            entities = self._extract_entities(text_lower)
+            keywords = self._extract_keywords(text_lower)
             
-            # Step 6: Generate actionable recommendations
+            # Step 7: Generate actionable recommendations
             recommendations = self._generate_recommendations(classification, priority)
             
-            # Step 7: Assess overall risk level
-            risk_assessment = self._assess_risk(classification, priority, cleaned_text)
+            # Step 8: Assess overall risk level
+            risk_assessment = self._assess_risk(classification, priority, hits)
             
-            # Step 8: Determine document type if not provided
+            # Step 9: Determine document type if not provided
             if not document_type:
-                document_type = self._determine_document_type(cleaned_text)
+                document_type = self._determine_document_type(hits)
             
             # Create and return structured response
             response = ProcessingResponse(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 summary=summary,
                 details=self._generate_details(classification, priority),
                 classification=classification,
@@ -295,7 +772,13 @@ class VesselMaintenanceAI:
                 }
             )
             
-            self.logger.info(f"Document processed successfully: {classification} - {priority}")
+            if log_info:
+                self.logger.info(f"Document processed successfully: {classification} - {priority}")
+            
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = response.model_copy(deep=True)
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
             return response
             
         except Exception as e:
@@ -319,22 +802,22 @@ class VesselMaintenanceAI:
         Returns:
             str: Cleaned and normalized text
         """
-        # Remove excessive whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove special characters that don't add meaning
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)]', ' ', text)
+        # Remove special characters that don't add meaning; a translate
+        # table covers plain ASCII text without running the regex engine
+        if text.isascii():
+            text = text.translate(_SPECIAL_ASCII)
+        else:
+            text = _SPECIAL_RE.sub(' ', text)
         
-        # Normalize multiple punctuation marks
-        text = re.sub(r'[\.]{2,}', '.', text)
-        text = re.sub(r'[\!]{2,}', '!', text)
+        # Collapse runs of repeated dots or exclamation marks
+        text = _REPEAT_PUNCT_RE.sub(r'\1', text)
         
-        # Remove extra spaces
+        # Normalize line breaks and collapse all whitespace runs
         text = ' '.join(text.split())
         
         return text
     
-    def _classify_document(self, text: str) -> Tuple[str, float]:
+    def _classify_document(self, hits: set) -> Tuple[str, float]:
         """
         Classify document into one of the predefined categories.
         
@@ -342,57 +825,24 @@ class VesselMaintenanceAI:
         appropriate classification for the document.
         
         Args:
-            text (str): Preprocessed document text
+            hits (set): Terms found in the document by _scan
             
         Returns:
             Tuple[str, float]: Classification label and confidence score
         """
-        text_lower = text.lower()
-        scores = {}
+        # Mark which terms occur, then score every category at once
+        presence = np.zeros(len(self._term_index), dtype=np.int8)
+        for term in hits:
+            presence[self._term_index[term]] = 1
+        best, max_score, confidence = _score_classifications(self._W, presence)
         
-        # Calculate scores for each classification category
-        for classification, pattern_data in self.patterns.items():
-            score = 0.0
-            
-            # Score based on keyword matches
-            keyword_matches = sum(1 for keyword in pattern_data["keywords"] 
-                                if keyword in text_lower)
-            score += keyword_matches * 0.4
-            
-            # Score based on equipment terminology
-            equipment_matches = sum(1 for term in pattern_data["equipment_terms"] 
-                                  if term in text_lower)
-            score += equipment_matches * 0.3
-            
-            # Score based on priority indicators
-            priority_matches = sum(1 for indicator in pattern_data["priority_indicators"] 
-                                 if indicator in text_lower)
-            score += priority_matches * 0.3
-            
-            # Apply category weight
-            score *= pattern_data["weight"]
-            
-            scores[classification] = score
-        
-        # Find the highest scoring classification
-        if scores:
-            best_classification = max(scores.keys(), key=lambda k: scores[k])
-            max_score = scores[best_classification]
-            
-            # Calculate confidence as normalized score
-            total_score = sum(scores.values())
-            confidence = max_score / total_score if total_score > 0 else 0.0
-            
-            # Ensure minimum classification if no strong matches
-            if max_score < 0.5:
-                return ClassificationType.ROUTINE_MAINTENANCE, 0.1
-            
-            return best_classification, min(confidence, 1.0)
+        # Ensure minimum classification if no strong matches
+        if max_score < 0.5:
+            return ClassificationType.ROUTINE_MAINTENANCE, 0.1
         
-        # Default fallback classification
-        return ClassificationType.ROUTINE_MAINTENANCE, 0.1
+        return self._classifications[best], min(confidence, 1.0)
     
-    def _determine_priority(self, text: str, classification: str) -> str:
+    def _determine_priority(self, hits: set, classification: str) -> str:
         """
         Determine priority level based on text content and classification.
         
@@ -400,52 +850,32 @@ class VesselMaintenanceAI:
         appropriate priority levels.
         
         Args:
-            text (str): Document text to analyze
+            hits (set): Terms found in the document by _scan
             classification (str): Document classification
             
         Returns:
             str: Priority level (Critical, High, Medium, Low)
         """
-        text_lower = text.lower()
-        
-        # Critical priority indicators
-        critical_keywords = [
-            "critical", "emergency", "immediate", "urgent", "danger",
-            "failure", "shutdown", "stop", "collision", "fire", "flood"
-        ]
-        
-        # High priority indicators
-        high_keywords = [
-            "warning", "alert", "malfunction", "leak", "damage",
-            "hazard", "risk", "violation", "non-compliance"
-        ]
-        
-        # Medium priority indicators
-        medium_keywords = [
-            "attention", "monitor", "check", "inspect", "service",
-            "repair", "replace", "maintenance"
-        ]
-        
         # Check for critical indicators
-        if any(keyword in text_lower for keyword in critical_keywords):
+        if not self.CRITICAL_KEYWORDS.isdisjoint(hits):
             return PriorityLevel.CRITICAL
         
         # Classification-based priority assignment
         if classification == ClassificationType.CRITICAL_EQUIPMENT_FAILURE:
             return PriorityLevel.CRITICAL
         elif classification == ClassificationType.ENVIRONMENTAL_COMPLIANCE:
-            return PriorityLevel.CRITICAL if any(word in text_lower for word in ["spill", "discharge", "violation"]) else PriorityLevel.HIGH
+            return PriorityLevel.CRITICAL if not self.ENVIRONMENTAL_CRITICAL_TERMS.isdisjoint(hits) else PriorityLevel.HIGH
         elif classification == ClassificationType.NAVIGATIONAL_HAZARD:
             return PriorityLevel.HIGH
         elif classification == ClassificationType.SAFETY_VIOLATION:
-            return PriorityLevel.HIGH if any(word in text_lower for word in ["accident", "injury"]) else PriorityLevel.MEDIUM
+            return PriorityLevel.HIGH if not self.SAFETY_HIGH_TERMS.isdisjoint(hits) else PriorityLevel.MEDIUM
         
         # Check for high priority indicators
-        if any(keyword in text_lower for keyword in high_keywords):
+        if not self.HIGH_KEYWORDS.isdisjoint(hits):
             return PriorityLevel.HIGH
         
         # Check for medium priority indicators
-        if any(keyword in text_lower for keyword in medium_keywords):
+        if not self.MEDIUM_KEYWORDS.isdisjoint(hits):
             return PriorityLevel.MEDIUM
         
         # Default to low priority
@@ -465,20 +895,25 @@ class VesselMaintenanceAI:
         Returns:
             str: Concise document summary
         """
+        if self.sentence_tokenizer is None:
+            return text[:max_length] + "..." if len(text) > max_length else text
+        
         try:
-            # Use TextBlob for sentence extraction
-            blob = TextBlob(text)
-            sentences = blob.sentences
+            # Split into sentences with the cached Punkt tokenizer. Only the
+            # leading sentences can fit in the summary, so a window of twice
+            # the summary length is enough; anything cut at its edge is
+            # already too long to be included
+            sentences = self.sentence_tokenizer.tokenize(text[:2 * max_length])
             
             if not sentences:
                 return text[:max_length] + "..." if len(text) > max_length else text
             
             # Start with the first sentence as it's often the most important
-            summary = str(sentences[0])
+            summary = sentences[0]
             
             # Add additional sentences if there's space
             for sentence in sentences[1:]:
-                potential_summary = summary + " " + str(sentence)
+                potential_summary = summary + " " + sentence
                 if len(potential_summary) <= max_length:
                     summary = potential_summary
                 else:
@@ -495,15 +930,16 @@ class VesselMaintenanceAI:
             # Fallback to simple truncation
             return text[:max_length] + "..." if len(text) > max_length else text
     
-    def _extract_entities(self, text: str) -> Dict[str, List[str]]:
+    def _extract_entities(self, text_lower: str) -> Dict[str, List[str]]:
         """
         Extract relevant entities from the document text.
         
         Identifies and categorizes important entities such as equipment,
-        measurements, dates, and personnel using regex patterns.
+        measurements, dates, and personnel using regex patterns. Entities
+        are reported in lowercase.
         
         Args:
-            text (str): Document text to analyze
+            text_lower (str): Lowercased document text to analyze
             
         Returns:
             Dict[str, List[str]]: Categorized entities found in the text
@@ -516,75 +952,49 @@ class VesselMaintenanceAI:
             "personnel": []
         }
         
-        # Entity extraction using regex patterns
-        equipment_patterns = [
-            r'\b(engine|motor|pump|valve|turbine|generator|propeller)\b',
-            r'\b(radar|gps|compass|navigation|steering)\b',
-            r'\b(hull|deck|bridge|compartment)\b'
-        ]
-        
-        for pattern in equipment_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities["equipment"].extend(matches)
+        # Entity extraction using precompiled regex patterns
+        entities["equipment"] = _EQUIPMENT_RE.findall(text_lower)
             
         # Extract dates in various formats
-        date_pattern = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
-        entities["dates"] = re.findall(date_pattern, text)
+        entities["dates"] = _DATE_RE.findall(text_lower)
         
         # Extract measurements with units
-        measurement_pattern = r'\b\d+\.?\d*\s*(meters?|feet|inches|kg|lbs|degrees?|psi|bar)\b'
-        entities["measurements"] = re.findall(measurement_pattern, text, re.IGNORECASE)
+        entities["measurements"] = _MEASUREMENT_RE.findall(text_lower)
         
         # Remove duplicates from all entity lists
         for key in entities:
-            entities[key] = list(set(entities[key]))
+            entities[key] = list(dict.fromkeys(entities[key]))
             
         return entities
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_keywords(self, text_lower: str) -> List[str]:
         """
         Extract important keywords from the document text.
         
-        Uses TextBlob for noun phrase extraction and frequency analysis
-        to identify the most relevant terms.
+        Uses word frequency analysis over a regex tokenization to identify
+        the most relevant terms.
         
         Args:
-            text (str): Document text to analyze
+            text_lower (str): Lowercased document text to analyze
             
         Returns:
             List[str]: List of important keywords and phrases
         """
         try:
-            # Use TextBlob for basic keyword extraction
-            blob = TextBlob(text)
-            
-            # Get noun phrases (often more meaningful than single words)
-            noun_phrases = [str(phrase).lower() for phrase in blob.noun_phrases]
-            
-            # Get individual words with frequency analysis
-            words = [word.lower() for word in text.split() if len(word) > 3]
-            word_freq = {}
-            for word in words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # Get top frequent words
-            top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-            keywords = [word[0] for word in top_words]
-            
-            # Combine noun phrases and keywords, remove duplicates
-            all_keywords = list(set(noun_phrases + keywords))
-            
-            # Filter out common words and return top keywords
-            filtered_keywords = [kw for kw in all_keywords 
-                               if len(kw) > 2 and kw not in ['the', 'and', 'for', 'are', 'with']]
+            # Count individual words, skipping short and common ones
+            word_freq = Counter(
+                word for word in _WORD_RE.findall(text_lower)
+                if len(word) > 3 and word not in _STOPWORDS
+            )
             
-            return filtered_keywords[:15]  # Return top 15 keywords
+            # Return the most frequent words
+            return [word for word, _ in word_freq.most_common(10)]
             
         except Exception as e:
             self.logger.warning(f"Error extracting keywords: {e}")
             # Fallback to simple word extraction
-            words = text.lower().split()
-            return list(set([word for word in words if len(word) > 4]))[:10]
+            words = text_lower.split()
+            return list({word for word in words if len(word) > 4})[:10]
     
     def _generate_recommendations(self, classification: str, priority: str) -> List[str]:
         """
@@ -600,79 +1010,17 @@ class VesselMaintenanceAI:
         Returns:
             List[str]: List of recommended actions
         """
-        recommendations = []
-        
-        # Priority-based general recommendations
-        if priority == PriorityLevel.CRITICAL:
-            recommendations.extend([
-                "IMMEDIATE ACTION REQUIRED",
-                "Stop operations immediately if safe to do so",
-                "Contact technical support team",
-                "Initiate emergency response procedures",
-                "Document all findings thoroughly"
-            ])
-        elif priority == PriorityLevel.HIGH:
-            recommendations.extend([
-                "Address within 24 hours",
-                "Notify relevant personnel",
-                "Schedule immediate inspection",
-                "Prepare contingency plans"
-            ])
-        
-        # Classification-specific recommendations
-        if classification == ClassificationType.CRITICAL_EQUIPMENT_FAILURE:
-            recommendations.extend([
-                "Isolate affected equipment",
-                "Order replacement parts immediately",
-                "Consider emergency port call if necessary",
-                "Implement backup systems if available"
-            ])
-        elif classification == ClassificationType.NAVIGATIONAL_HAZARD:
-            recommendations.extend([
-                "Increase bridge watch",
-                "Use manual navigation procedures",
-                "Contact vessel traffic services",
-                "Reduce speed if conditions warrant"
-            ])
-        elif classification == ClassificationType.ENVIRONMENTAL_COMPLIANCE:
-            recommendations.extend([
-                "Stop any discharge operations",
-                "Contact environmental compliance officer",
-                "Prepare incident report for authorities",
-                "Implement containment measures"
-            ])
-        elif classification == ClassificationType.ROUTINE_MAINTENANCE:
-            recommendations.extend([
-                "Schedule maintenance during next port call",
-                "Order required spare parts",
-                "Assign qualified personnel",
-                "Update maintenance logs"
-            ])
-        elif classification == ClassificationType.SAFETY_VIOLATION:
-            recommendations.extend([
-                "Immediate safety briefing for crew",
-                "Review safety procedures",
-                "Ensure proper PPE usage",
-                "Report to safety officer"
-            ])
-        elif classification == ClassificationType.FUEL_EFFICIENCY:
-            recommendations.extend([
-                "Monitor fuel consumption patterns",
-                "Optimize engine parameters",
-                "Review voyage planning",
-                "Consider trim adjustments"
-            ])
-        
-        # Add general recommendations
-        if priority in [PriorityLevel.MEDIUM, PriorityLevel.LOW]:
-            recommendations.extend([
-                "Monitor pressure levels continuously",
-                "Investigate leak source and implement temporary repairs"
-            ])
-        
-        return list(set(recommendations))  # Remove duplicates
-    
-    def _assess_risk(self, classification: str, priority: str, text: str) -> str:
+        # Priority actions first, then classification-specific actions,
+        # then general follow-ups
+        recommendations = (
+            self.PRIORITY_RECOMMENDATIONS.get(priority, ()) +
+            self.CLASSIFICATION_RECOMMENDATIONS.get(classification, ()) +
+            self.FOLLOW_UP_RECOMMENDATIONS.get(priority, ())
+        )
+        
+        return list(dict.fromkeys(recommendations))  # Remove duplicates, keep order
+    
+    def _assess_risk(self, classification: str, priority: str, hits: set) -> str:
         """
         Assess overall risk level based on classification, priority, and content.
         
@@ -681,36 +1029,19 @@ class VesselMaintenanceAI:
         Args:
             classification (str): Document classification
             priority (str): Priority level
-            text (str): Document text for additional context
+            hits (set): Terms found in the document by _scan
             
         Returns:
             str: Risk assessment description
         """
-        risk_factors = []
-        
         # Priority-based risk assessment
-        if priority == PriorityLevel.CRITICAL:
-            base_risk = "CRITICAL RISK: Immediate threat to vessel safety, operations, or environment."
-        elif priority == PriorityLevel.HIGH:
-            base_risk = "HIGH RISK: Significant impact on operations or safety if not addressed promptly."
-        elif priority == PriorityLevel.MEDIUM:
-            base_risk = "MEDIUM RISK: Moderate impact on operations, requires attention within reasonable timeframe."
-        else:
-            base_risk = "LOW RISK: Minor operational impact, routine maintenance required."
-        
-        # Add classification-specific risk factors
-        text_lower = text.lower()
-        
-        if "navigation" in text_lower or "gps" in text_lower:
-            risk_factors.append("Navigation safety impact")
-        if "fire" in text_lower or "explosion" in text_lower:
-            risk_factors.append("Fire/explosion hazard")
-        if "pollution" in text_lower or "spill" in text_lower:
-            risk_factors.append("Environmental impact")
-        if "pressure" in text_lower:
-            risk_factors.append("Pressure system risk")
-        if "temperature" in text_lower and ("high" in text_lower or "hot" in text_lower):
-            risk_factors.append("Overheating risk")
+        base_risk = self.RISK_BY_PRIORITY.get(priority, self.RISK_BY_PRIORITY[PriorityLevel.LOW])
+        
+        # Add content-specific risk factors
+        risk_factors = [
+            label for label, groups in self.RISK_FACTORS
+            if all(not group.isdisjoint(hits) for group in groups)
+        ]
         
         # Combine base risk with additional factors
         if risk_factors:
@@ -718,7 +1049,7 @@ class VesselMaintenanceAI:
         else:
             return base_risk
     
-    def _determine_document_type(self, text: str) -> str:
+    def _determine_document_type(self, hits: set) -> str:
         """
         Determine the type of document based on content analysis.
         
@@ -726,22 +1057,16 @@ class VesselMaintenanceAI:
         incident report, or inspection report.
         
         Args:
-            text (str): Document text to analyze
+            hits (set): Terms found in the document by _scan
             
         Returns:
             str: Detected document type
         """
-        text_lower = text.lower()
-        
         # Document type indicators
-        if any(word in text_lower for word in ["alert", "alarm", "sensor", "warning"]):
-            return DocumentType.SENSOR_ALERT
-        elif any(word in text_lower for word in ["incident", "accident", "spill", "collision"]):
-            return DocumentType.INCIDENT_REPORT
-        elif any(word in text_lower for word in ["inspection", "survey", "audit", "examination"]):
-            return DocumentType.INSPECTION_REPORT
-        else:
-            return DocumentType.MAINTENANCE_RECORD
+        for document_type, keywords in self.DOCUMENT_TYPE_KEYWORDS:
+            if any(word in hits for word in keywords):
+                return document_type
+        return DocumentType.MAINTENANCE_RECORD
     
     def _generate_details(self, classification: str, priority: str) -> str:
         """
@@ -757,31 +1082,11 @@ class VesselMaintenanceAI:
         Returns:
             str: Detailed explanation of the analysis
         """
-        details = []
-        
-        # Classification-specific details
-        if classification == ClassificationType.CRITICAL_EQUIPMENT_FAILURE:
-            details.append("Critical equipment failure detected. Immediate attention required to prevent operational disruption or safety hazards.")
-        elif classification == ClassificationType.NAVIGATIONAL_HAZARD:
-            details.append("Navigation-related issue identified. Take appropriate measures to ensure safe navigation.")
-        elif classification == ClassificationType.ENVIRONMENTAL_COMPLIANCE:
-            details.append("Environmental compliance issue detected. Immediate action needed to prevent regulatory violations.")
-        elif classification == ClassificationType.ROUTINE_MAINTENANCE:
-            details.append("Routine maintenance requirement identified. Schedule appropriate maintenance activities.")
-        elif classification == ClassificationType.SAFETY_VIOLATION:
-            details.append("Safety violation detected. Review and reinforce safety procedures immediately.")
-        elif classification == ClassificationType.FUEL_EFFICIENCY:
-            details.append("Fuel efficiency concern identified. Consider optimization measures to improve performance.")
-        
-        # Priority-specific details
-        if priority == PriorityLevel.CRITICAL:
-            details.append("CRITICAL priority requires immediate action to prevent serious consequences.")
-        elif priority == PriorityLevel.HIGH:
-            details.append("HIGH priority should be addressed within 24 hours to prevent escalation.")
-        
-        # Add generic operational details
-        details.append("Pressure-related issue identified - monitor system pressure closely.")
-        details.append("Temperature anomaly detected - check cooling systems and ventilation.")
+        details = (
+            self.CLASSIFICATION_DETAILS.get(classification, ()) +
+            self.PRIORITY_DETAILS.get(priority, ()) +
+            self.GENERAL_DETAILS
+        )
         
         return " ".join(details)
     
@@ -799,7 +1104,7 @@ class VesselMaintenanceAI:
             ProcessingResponse: Error response with default values
         """
         return ProcessingResponse(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             summary="Error processing document",
             details=f"An error occurred during processing: {error_message}",
             classification=ClassificationType.ROUTINE_MAINTENANCE,